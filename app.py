@@ -1,21 +1,41 @@
-import json
+import orjson
 import dash
-from dash import dcc, html, Input, Output, callback, dash_table
+from dash import dcc, html, Input, Output, callback, dash_table, ctx
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+from flask_compress import Compress
+from flask_caching import Cache
 import plotly.express as px
+import plotly.io as pio
 import pandas as pd
+import numpy as np
 import networkx as nx
 from urllib.parse import urlparse
 import math
+from functools import lru_cache
 
 # Load schema data
-with open('odissei_schema_processed.json', 'r') as f:
-    schema_data = json.load(f)
+with open('odissei_schema_processed.json', 'rb') as f:
+    schema_data = orjson.loads(f.read())
+
+# Serialize callback payloads (figures, tables) with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = "orjson"
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "ODISSEI Schema Visualizer - Python Edition"
+server = app.server  # WSGI entry point for production servers, e.g. `gunicorn -c gunicorn_conf.py app:server`
+
+# Compress layouts, callback payloads and static assets on the wire
+app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+app.server.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+Compress(app.server)
+
+# Memoize table callbacks; their output depends only on the inputs and the static schema
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'SimpleCache',
+    'CACHE_DEFAULT_TIMEOUT': 3600,
+    'CACHE_THRESHOLD': 256
+})
 
 # Define namespace colors
 namespace_colors = {
@@ -37,23 +57,51 @@ namespace_colors = {
     "default": "#6B7280"
 }
 
+@lru_cache(maxsize=4096)
 def get_namespace_from_uri(uri):
     if '#' in uri:
-        return uri.split('#')[0] + '#'
+        return uri.partition('#')[0] + '#'
     else:
-        parts = uri.split('/')
-        return '/'.join(parts[:-1]) + '/'
+        return uri.rpartition('/')[0] + '/'
 
 def get_color_for_namespace(namespace):
     return namespace_colors.get(namespace, namespace_colors["default"])
 
+@lru_cache(maxsize=4096)
 def get_namespace_short_name(namespace):
-    return namespace.split('/')[-1].replace('#', '') or namespace.split('/')[-2]
+    head, _, tail = namespace.rpartition('/')
+    return tail.replace('#', '') or head.rpartition('/')[2]
+
+# Build the classes/predicates tables once; the schema does not change while the app runs.
+# Namespaces are stored as categoricals so the namespace filter compares integer codes, and
+# a lowercased blob of the searchable columns (joined with a separator no term will contain)
+# lets the search run a single substring scan.
+CLASSES_DF = pd.DataFrame(schema_data['classes']['all'])
+CLASSES_DF['namespace'] = CLASSES_DF['uri'].map(get_namespace_from_uri).astype('category')
+CLASSES_DF['namespace_short'] = CLASSES_DF['namespace'].map(get_namespace_short_name).astype('category')
+CLASSES_DF['_search_blob'] = CLASSES_DF['local_name'].str.cat(CLASSES_DF['uri'], sep='\x1f').str.lower()
+
+PREDICATES_DF = pd.DataFrame(schema_data['predicates']['domain_specific'])
+PREDICATES_DF['namespace'] = PREDICATES_DF['uri'].map(get_namespace_from_uri).astype('category')
+PREDICATES_DF['namespace_short'] = PREDICATES_DF['namespace'].map(get_namespace_short_name).astype('category')
+PREDICATES_DF['_search_blob'] = PREDICATES_DF['local_name'].str.cat(PREDICATES_DF['uri'], sep='\x1f').str.lower()
+
+def build_namespace_options(namespaces):
+    return [{"label": "All Namespaces", "value": "all"}] + \
+           [{"label": get_namespace_short_name(ns), "value": ns} for ns in sorted(namespaces)]
+
+NAMESPACE_OPTIONS_CLASSES = build_namespace_options(CLASSES_DF['namespace'].unique())
+NAMESPACE_OPTIONS_PREDICATES = build_namespace_options(PREDICATES_DF['namespace'].unique())
 
-# Create network graph data
+# Node colors are looked up by namespace category code; the trailing default entry
+# is what code -1 (a namespace outside the known categories) indexes
+NAMESPACE_DTYPE = pd.CategoricalDtype(sorted(set(CLASSES_DF['namespace'].cat.categories) |
+                                             set(PREDICATES_DF['namespace'].cat.categories)))
+NAMESPACE_COLOR_LUT = np.array([get_color_for_namespace(ns) for ns in NAMESPACE_DTYPE.categories] +
+                               [namespace_colors["default"]])
+
+# Create network graph data as parallel node columns plus (i, j) edges between node indices
 def create_network_graph(selected_group='all'):
-    G = nx.Graph()
-    
     # Filter data based on selection
     if selected_group == 'all':
         classes = schema_data['classes']['all'][:30]  # Limit for performance
@@ -68,82 +116,113 @@ def create_network_graph(selected_group='all'):
         predicates = [pred for pred in schema_data['predicates']['domain_specific'] 
                      if get_namespace_from_uri(pred['uri']) == selected_group][:15]
     
-    # Add nodes
+    # Add nodes, keyed by URI so a predicate sharing a class URI replaces it in place
+    nodes = {}
     for cls in classes:
-        G.add_node(cls['uri'], 
-                  label=cls['local_name'], 
-                  type='class',
-                  namespace=get_namespace_from_uri(cls['uri']))
+        nodes[cls['uri']] = (cls['local_name'], 'class')
     
     for pred in predicates:
-        G.add_node(pred['uri'], 
-                  label=pred['local_name'], 
-                  type='predicate',
-                  namespace=get_namespace_from_uri(pred['uri']))
+        nodes[pred['uri']] = (pred['local_name'], 'predicate')
+    
+    uris = list(nodes)
     
     # Add some sample edges (in a real implementation, you'd query for actual relationships)
-    nodes = list(G.nodes())
-    for i in range(min(len(nodes) - 1, 25)):
-        if i % 3 == 0:  # Add some edges
-            G.add_edge(nodes[i], nodes[i + 1])
+    edges = [(i, i + 1) for i in range(min(len(uris) - 1, 25)) if i % 3 == 0]
     
-    return G
+    return {
+        'uris': uris,
+        'labels': [label for label, _ in nodes.values()],
+        'types': [node_type for _, node_type in nodes.values()],
+        'namespaces': [get_namespace_from_uri(uri) for uri in uris],
+        'edges': edges
+    }
 
-def create_plotly_network(G):
-    # Use spring layout for positioning
-    pos = nx.spring_layout(G, k=3, iterations=50)
+def create_plotly_network(graph):
+    # Use spring layout for positioning; the layout graph only needs node indices and edges
+    G = nx.Graph()
+    G.add_nodes_from(range(len(graph['uris'])))
+    G.add_edges_from(graph['edges'])
+    pos = nx.spring_layout(G, k=3, iterations=30, seed=42)
+    
+    # Create edge traces; each edge is drawn as (x0, x1, NaN) so segments stay disconnected
+    pos_arr = np.array([pos[i] for i in range(len(graph['uris']))]).reshape(-1, 2)
+    edges = np.array(graph['edges'], dtype=np.int32).reshape(-1, 2)
     
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
+    edge_x = np.full(3 * len(edges), np.nan)
+    edge_y = np.full(3 * len(edges), np.nan)
+    edge_x[0::3] = pos_arr[edges[:, 0], 0]
+    edge_x[1::3] = pos_arr[edges[:, 1], 0]
+    edge_y[0::3] = pos_arr[edges[:, 0], 1]
+    edge_y[1::3] = pos_arr[edges[:, 1], 1]
     
-    edge_trace = go.Scatter(x=edge_x, y=edge_y,
-                           line=dict(width=1, color='#E5E7EB'),
-                           hoverinfo='none',
-                           mode='lines')
+    edge_trace = dict(type='scattergl', x=edge_x, y=edge_y,
+                      line=dict(width=1, color='#E5E7EB'),
+                      hoverinfo='none',
+                      mode='lines')
     
     # Create node traces
-    node_x = []
-    node_y = []
-    node_text = []
-    node_colors = []
-    node_sizes = []
-    node_info = []
+    node_x = pos_arr[:, 0]
+    node_y = pos_arr[:, 1]
+    namespace_codes = pd.Categorical(graph['namespaces'], dtype=NAMESPACE_DTYPE).codes
+    node_colors = NAMESPACE_COLOR_LUT[namespace_codes]
+    
+    # Create hover info
+    namespace_short = pd.Series(graph['namespaces'], dtype=object).map(get_namespace_short_name)
+    node_info = ("<b>" + pd.Series(graph['labels'], dtype=object) + "</b><br>" +
+                 "Type: " + pd.Series(graph['types'], dtype=object) + "<br>" +
+                 "Namespace: " + namespace_short + "<br>" +
+                 "URI: " + pd.Series(graph['uris'], dtype=object)).tolist()
     
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        
-        node_data = G.nodes[node]
-        node_text.append(node_data['label'])
-        node_colors.append(get_color_for_namespace(node_data['namespace']))
-        node_sizes.append(20 if node_data['type'] == 'class' else 15)
-        
-        # Create hover info
-        namespace_short = get_namespace_short_name(node_data['namespace'])
-        node_info.append(f"<b>{node_data['label']}</b><br>" +
-                        f"Type: {node_data['type']}<br>" +
-                        f"Namespace: {namespace_short}<br>" +
-                        f"URI: {node}")
+    node_sizes = np.where(np.array(graph['types']) == 'class', 20, 15)
     
-    node_trace = go.Scatter(x=node_x, y=node_y,
-                           mode='markers+text',
-                           hovertemplate='%{hovertext}<extra></extra>',
-                           hovertext=node_info,
-                           text=node_text,
-                           textposition="top center",
-                           marker=dict(size=node_sizes,
-                                     color=node_colors,
-                                     line=dict(width=2, color='white')))
+    node_trace = dict(type='scattergl', x=node_x, y=node_y,
+                      mode='markers+text',
+                      hovertemplate='%{hovertext}<extra></extra>',
+                      hovertext=node_info,
+                      text=graph['labels'],
+                      textposition="top center",
+                      marker=dict(size=node_sizes,
+                                  color=node_colors,
+                                  line=dict(width=2, color='white')))
     
     return [edge_trace, node_trace]
 
+# Statistics cards; the counts come from the static schema file, so the row is built once
+STATS_ROW = dbc.Row([
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4(str(schema_data['metadata']['total_classes']), className="card-title"),
+                html.P("Total Classes", className="card-text")
+            ])
+        ])
+    ], width=3),
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4(str(schema_data['metadata']['total_predicates']), className="card-title"),
+                html.P("Total Predicates", className="card-text")
+            ])
+        ])
+    ], width=3),
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4(str(len(schema_data['namespaces']['odissei_namespaces'])), className="card-title"),
+                html.P("ODISSEI Namespaces", className="card-text")
+            ])
+        ])
+    ], width=3),
+    dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4(str(schema_data['metadata']['domain_specific_predicates']), className="card-title"),
+                html.P("Domain Predicates", className="card-text")
+            ])
+        ])
+    ], width=3)
+], className="mb-4")
+
 # App layout
 app.layout = dbc.Container([
     dbc.Row([
@@ -156,40 +235,7 @@ app.layout = dbc.Container([
     ]),
     
     # Statistics cards
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(str(schema_data['metadata']['total_classes']), className="card-title"),
-                    html.P("Total Classes", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(str(schema_data['metadata']['total_predicates']), className="card-title"),
-                    html.P("Total Predicates", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(str(len(schema_data['namespaces']['odissei_namespaces'])), className="card-title"),
-                    html.P("ODISSEI Namespaces", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(str(schema_data['metadata']['domain_specific_predicates']), className="card-title"),
-                    html.P("Domain Predicates", className="card-text")
-                ])
-            ])
-        ], width=3)
-    ], className="mb-4"),
+    STATS_ROW,
     
     # Tabs
     dbc.Tabs([
@@ -209,13 +255,13 @@ app.layout = dbc.Container([
 )
 def render_tab_content(active_tab):
     if active_tab == "overview":
-        return render_overview()
+        return OVERVIEW_CONTENT
     elif active_tab == "classes":
-        return render_classes()
+        return CLASSES_CONTENT
     elif active_tab == "predicates":
-        return render_predicates()
+        return PREDICATES_CONTENT
     elif active_tab == "visualization":
-        return render_visualization()
+        return VISUALIZATION_CONTENT
 
 def render_overview():
     return dbc.Row([
@@ -250,11 +296,6 @@ def render_overview():
     ])
 
 def render_classes():
-    # Create DataFrame for classes
-    classes_df = pd.DataFrame(schema_data['classes']['all'])
-    classes_df['namespace'] = classes_df['uri'].apply(get_namespace_from_uri)
-    classes_df['namespace_short'] = classes_df['namespace'].apply(get_namespace_short_name)
-    
     return dbc.Row([
         dbc.Col([
             dbc.Card([
@@ -262,30 +303,35 @@ def render_classes():
                 dbc.CardBody([
                     dbc.Row([
                         dbc.Col([
-                            dbc.Input(id="class-search", placeholder="Search classes...", type="text")
+                            dbc.Input(id="class-search", placeholder="Search classes...", type="text", debounce=True)
                         ], width=8),
                         dbc.Col([
                             dcc.Dropdown(
                                 id="class-namespace-filter",
-                                options=[{"label": "All Namespaces", "value": "all"}] + 
-                                       [{"label": get_namespace_short_name(ns), "value": ns} 
-                                        for ns in set(classes_df['namespace'])],
+                                options=NAMESPACE_OPTIONS_CLASSES,
                                 value="all"
                             )
                         ], width=4)
                     ], className="mb-3"),
-                    html.Div(id="classes-table")
+                    dash_table.DataTable(
+                        id="classes-table",
+                        columns=[
+                            {"name": "Class Name", "id": "local_name"},
+                            {"name": "Namespace", "id": "namespace_short"},
+                            {"name": "URI", "id": "uri"}
+                        ],
+                        style_cell={'textAlign': 'left', 'fontSize': '12px'},
+                        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+                        page_action='custom',
+                        page_current=0,
+                        page_size=20
+                    )
                 ])
             ])
         ])
     ])
 
 def render_predicates():
-    # Create DataFrame for predicates
-    predicates_df = pd.DataFrame(schema_data['predicates']['domain_specific'])
-    predicates_df['namespace'] = predicates_df['uri'].apply(get_namespace_from_uri)
-    predicates_df['namespace_short'] = predicates_df['namespace'].apply(get_namespace_short_name)
-    
     return dbc.Row([
         dbc.Col([
             dbc.Card([
@@ -293,19 +339,29 @@ def render_predicates():
                 dbc.CardBody([
                     dbc.Row([
                         dbc.Col([
-                            dbc.Input(id="predicate-search", placeholder="Search predicates...", type="text")
+                            dbc.Input(id="predicate-search", placeholder="Search predicates...", type="text", debounce=True)
                         ], width=8),
                         dbc.Col([
                             dcc.Dropdown(
                                 id="predicate-namespace-filter",
-                                options=[{"label": "All Namespaces", "value": "all"}] + 
-                                       [{"label": get_namespace_short_name(ns), "value": ns} 
-                                        for ns in set(predicates_df['namespace'])],
+                                options=NAMESPACE_OPTIONS_PREDICATES,
                                 value="all"
                             )
                         ], width=4)
                     ], className="mb-3"),
-                    html.Div(id="predicates-table")
+                    dash_table.DataTable(
+                        id="predicates-table",
+                        columns=[
+                            {"name": "Predicate Name", "id": "local_name"},
+                            {"name": "Namespace", "id": "namespace_short"},
+                            {"name": "URI", "id": "uri"}
+                        ],
+                        style_cell={'textAlign': 'left', 'fontSize': '12px'},
+                        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+                        page_action='custom',
+                        page_current=0,
+                        page_size=20
+                    )
                 ])
             ])
         ])
@@ -331,104 +387,126 @@ def render_visualization():
                             )
                         ], width=4)
                     ], className="mb-3"),
-                    dcc.Graph(id="network-graph", style={"height": "600px"})
+                    dcc.Loading(
+                        dcc.Graph(id="network-graph", style={"height": "600px"}),
+                        type="default"
+                    )
                 ])
             ])
         ])
     ])
 
+# Tab contents only depend on the static schema, so build them once and reuse them;
+# the tables and graph inside are filled in by their own callbacks
+OVERVIEW_CONTENT = render_overview()
+CLASSES_CONTENT = render_classes()
+PREDICATES_CONTENT = render_predicates()
+VISUALIZATION_CONTENT = render_visualization()
+
 # Callbacks for filtering
 @app.callback(
-    Output("classes-table", "children"),
+    [Output("classes-table", "data"),
+     Output("classes-table", "page_count"),
+     Output("classes-table", "page_current")],
     [Input("class-search", "value"),
-     Input("class-namespace-filter", "value")]
+     Input("class-namespace-filter", "value"),
+     Input("classes-table", "page_current"),
+     Input("classes-table", "page_size")]
 )
-def update_classes_table(search_term, namespace_filter):
-    classes_df = pd.DataFrame(schema_data['classes']['all'])
-    classes_df['namespace'] = classes_df['uri'].apply(get_namespace_from_uri)
-    classes_df['namespace_short'] = classes_df['namespace'].apply(get_namespace_short_name)
+def update_classes_table(search_term, namespace_filter, page_current, page_size):
+    # A new search or namespace filter starts again from the first page
+    if ctx.triggered_id in ("class-search", "class-namespace-filter"):
+        page_current = 0
+    return classes_table_page(search_term, namespace_filter, page_current, page_size)
+
+@cache.memoize()
+def classes_table_page(search_term, namespace_filter, page_current, page_size):
+    classes_df = CLASSES_DF
     
     # Apply filters
     if search_term:
-        mask = classes_df['local_name'].str.contains(search_term, case=False, na=False) | \
-               classes_df['uri'].str.contains(search_term, case=False, na=False)
-        classes_df = classes_df[mask]
+        term = search_term.lower()
+        classes_df = classes_df[classes_df['_search_blob'].str.contains(term, regex=False, na=False)]
     
     if namespace_filter and namespace_filter != "all":
         classes_df = classes_df[classes_df['namespace'] == namespace_filter]
     
-    return dash_table.DataTable(
-        data=classes_df[['local_name', 'namespace_short', 'uri']].to_dict('records'),
-        columns=[
-            {"name": "Class Name", "id": "local_name"},
-            {"name": "Namespace", "id": "namespace_short"},
-            {"name": "URI", "id": "uri"}
-        ],
-        style_cell={'textAlign': 'left', 'fontSize': '12px'},
-        style_data={'whiteSpace': 'normal', 'height': 'auto'},
-        page_size=20
-    )
+    # Only serialize the rows on the requested page
+    page_count = max(math.ceil(len(classes_df) / page_size), 1)
+    page_current = min(page_current or 0, page_count - 1)
+    start = page_current * page_size
+    page_df = classes_df.iloc[start:start + page_size]
+    
+    return page_df[['local_name', 'namespace_short', 'uri']].to_dict('records'), page_count, page_current
 
 @app.callback(
-    Output("predicates-table", "children"),
+    [Output("predicates-table", "data"),
+     Output("predicates-table", "page_count"),
+     Output("predicates-table", "page_current")],
     [Input("predicate-search", "value"),
-     Input("predicate-namespace-filter", "value")]
+     Input("predicate-namespace-filter", "value"),
+     Input("predicates-table", "page_current"),
+     Input("predicates-table", "page_size")]
 )
-def update_predicates_table(search_term, namespace_filter):
-    predicates_df = pd.DataFrame(schema_data['predicates']['domain_specific'])
-    predicates_df['namespace'] = predicates_df['uri'].apply(get_namespace_from_uri)
-    predicates_df['namespace_short'] = predicates_df['namespace'].apply(get_namespace_short_name)
+def update_predicates_table(search_term, namespace_filter, page_current, page_size):
+    # A new search or namespace filter starts again from the first page
+    if ctx.triggered_id in ("predicate-search", "predicate-namespace-filter"):
+        page_current = 0
+    return predicates_table_page(search_term, namespace_filter, page_current, page_size)
+
+@cache.memoize()
+def predicates_table_page(search_term, namespace_filter, page_current, page_size):
+    predicates_df = PREDICATES_DF
     
     # Apply filters
     if search_term:
-        mask = predicates_df['local_name'].str.contains(search_term, case=False, na=False) | \
-               predicates_df['uri'].str.contains(search_term, case=False, na=False)
-        predicates_df = predicates_df[mask]
+        term = search_term.lower()
+        predicates_df = predicates_df[predicates_df['_search_blob'].str.contains(term, regex=False, na=False)]
     
     if namespace_filter and namespace_filter != "all":
         predicates_df = predicates_df[predicates_df['namespace'] == namespace_filter]
     
-    return dash_table.DataTable(
-        data=predicates_df[['local_name', 'namespace_short', 'uri']].to_dict('records'),
-        columns=[
-            {"name": "Predicate Name", "id": "local_name"},
-            {"name": "Namespace", "id": "namespace_short"},
-            {"name": "URI", "id": "uri"}
-        ],
-        style_cell={'textAlign': 'left', 'fontSize': '12px'},
-        style_data={'whiteSpace': 'normal', 'height': 'auto'},
-        page_size=20
-    )
+    # Only serialize the rows on the requested page
+    page_count = max(math.ceil(len(predicates_df) / page_size), 1)
+    page_current = min(page_current or 0, page_count - 1)
+    start = page_current * page_size
+    page_df = predicates_df.iloc[start:start + page_size]
+    
+    return page_df[['local_name', 'namespace_short', 'uri']].to_dict('records'), page_count, page_current
 
 @app.callback(
     Output("network-graph", "figure"),
     Input("viz-group-selector", "value")
 )
 def update_network_graph(selected_group):
-    G = create_network_graph(selected_group)
-    traces = create_plotly_network(G)
-    
-    fig = go.Figure(data=traces,
-                   layout=go.Layout(
-                       title=f"Schema Network - {selected_group.replace('_', ' ').title()}",
-                       titlefont_size=16,
-                       showlegend=False,
-                       hovermode='closest',
-                       margin=dict(b=20,l=5,r=5,t=40),
-                       annotations=[ dict(
-                           text="Click and drag to explore the network",
-                           showarrow=False,
-                           xref="paper", yref="paper",
-                           x=0.005, y=-0.002,
-                           xanchor="left", yanchor="bottom",
-                           font=dict(color="#888", size=12)
-                       )],
-                       xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       plot_bgcolor='white'
-                   ))
+    return build_network_figure(selected_group)
+
+# The schema is static, so each group's figure only needs to be laid out once
+@lru_cache(maxsize=32)
+def build_network_figure(selected_group):
+    graph = create_network_graph(selected_group)
+    traces = create_plotly_network(graph)
     
-    return fig
+    # Plain dicts skip plotly's graph_objects validation; Dash sends them to Plotly.js as-is
+    return dict(data=traces,
+                layout=dict(
+                    title=dict(text=f"Schema Network - {selected_group.replace('_', ' ').title()}",
+                               font=dict(size=16)),
+                    showlegend=False,
+                    hovermode='closest',
+                    margin=dict(b=20,l=5,r=5,t=40),
+                    annotations=[ dict(
+                        text="Click and drag to explore the network",
+                        showarrow=False,
+                        xref="paper", yref="paper",
+                        x=0.005, y=-0.002,
+                        xanchor="left", yanchor="bottom",
+                        font=dict(color="#888", size=12)
+                    )],
+                    xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                    yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
+                    plot_bgcolor='white'
+                ))
 
 if __name__ == "__main__":
     app.run_server(debug=True, host='0.0.0.0', port=8050)
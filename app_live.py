@@ -1,14 +1,21 @@
-import json
+import orjson
 import dash
-from dash import dcc, html, Input, Output, callback, dash_table, State
+from dash import dcc, html, Input, Output, callback, dash_table, State, clientside_callback, no_update, ctx
 import dash_bootstrap_components as dbc
-import plotly.graph_objects as go
+from flask_caching import Cache
 import plotly.express as px
-import pandas as pd
+import plotly.io as pio
+import numpy as np
 import networkx as nx
 from datetime import datetime
+import fcntl
+import hashlib
+import os
+import tempfile
 import threading
 import time
+from functools import lru_cache
+from apscheduler.schedulers.background import BackgroundScheduler
 from sparql_client import SPARQLClient
 
 # Initialize SPARQL client
@@ -18,11 +25,24 @@ sparql_client = SPARQLClient(SPARQL_ENDPOINT)
 # Global variable to store schema data
 schema_data = {}
 last_update_time = None
+data_version = None  # Content hash of the schema data (see content_version); the same in every worker serving it
+schema_lock = threading.RLock()  # Held while replacing or snapshotting the globals above
+
+BACKUP_FILE = 'odissei_schema_live.json'
+SCHEDULER_LOCK_FILE = 'odissei_schema_live.lock'
+FETCH_LOCK_FILE = 'odissei_schema_fetch.lock'
+FETCH_INTERVAL = 300  # Seconds between SPARQL refreshes
+
+def content_version(data):
+    """Hash of the schema content, ignoring when it was fetched, so processes holding the same data agree on it"""
+    metadata = {key: value for key, value in data.get('metadata', {}).items() if key != 'last_updated'}
+    raw = orjson.dumps({**data, 'metadata': metadata}, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
 
 # Load initial data from file as fallback
 try:
-    with open('odissei_schema_processed.json', 'r') as f:
-        schema_data = json.load(f)
+    with open('odissei_schema_processed.json', 'rb') as f:
+        schema_data = orjson.loads(f.read())
         last_update_time = "Loaded from file"
 except FileNotFoundError:
     # If no file, create empty structure
@@ -33,10 +53,16 @@ except FileNotFoundError:
         "predicates": {"all": [], "domain_specific": []}
     }
 
+# Serialize callback payloads (stores, figures) with orjson instead of the stdlib json encoder
+pio.json.config.default_engine = "orjson"
+
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "ODISSEI Schema Visualizer - Live Data"
 
+# Cache network graph data per (selected group, data version)
+cache = Cache(app.server, config={'CACHE_TYPE': 'SimpleCache'})
+
 # Define namespace colors
 namespace_colors = {
     "https://portal.odissei.nl/schema/geospatial#": "#3B82F6",
@@ -57,58 +83,164 @@ namespace_colors = {
     "default": "#6B7280"
 }
 
+@lru_cache(maxsize=4096)
 def get_namespace_from_uri(uri):
     if '#' in uri:
-        return uri.split('#')[0] + '#'
+        return uri.partition('#')[0] + '#'
     else:
-        parts = uri.split('/')
-        return '/'.join(parts[:-1]) + '/'
+        return uri.rpartition('/')[0] + '/'
 
+@lru_cache(maxsize=4096)
 def get_color_for_namespace(namespace):
     return namespace_colors.get(namespace, namespace_colors["default"])
 
+@lru_cache(maxsize=4096)
 def get_namespace_short_name(namespace):
-    return namespace.split('/')[-1].replace('#', '') or namespace.split('/')[-2]
+    head, _, tail = namespace.rpartition('/')
+    return tail.replace('#', '') or head.rpartition('/')[2]
+
+def add_namespace_columns(data):
+    """Annotate every class and predicate row with its namespace and short namespace name"""
+    for group in ('classes', 'predicates'):
+        for rows in data.get(group, {}).values():
+            for row in rows:
+                namespace = get_namespace_from_uri(row['uri'])
+                row['namespace'] = namespace
+                row['namespace_short'] = get_namespace_short_name(namespace)
+    return data
+
+# Annotate the fallback data loaded from file
+add_namespace_columns(schema_data)
+data_version = content_version(schema_data)
+
+def set_schema_data(new_data, update_time, version):
+    """Replace the global schema data along with its content version"""
+    global schema_data, last_update_time, data_version
+    with schema_lock:
+        schema_data = new_data
+        last_update_time = update_time
+        data_version = version
 
 def update_schema_data():
-    """Update schema data from SPARQL endpoint"""
-    global schema_data, last_update_time
+    """Update schema data from SPARQL endpoint; only one process on the host queries it at a time"""
+    started = time.time()
     try:
-        print("Fetching data from SPARQL endpoint...")
-        new_data = sparql_client.fetch_schema_data()
-        if new_data and new_data.get('classes', {}).get('all'):
-            schema_data = new_data
-            last_update_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            schema_data['metadata']['last_updated'] = last_update_time
-            print(f"Data updated successfully at {last_update_time}")
+        with open(FETCH_LOCK_FILE, 'w') as fetch_lock:
+            fcntl.flock(fetch_lock, fcntl.LOCK_EX)
+            
+            # Another worker finished a fetch while we waited for the lock; use its result
+            # instead of querying the endpoint again
+            try:
+                if os.path.getmtime(BACKUP_FILE) >= started:
+                    reload_schema_backup()
+                    return
+            except FileNotFoundError:
+                pass
             
-            # Save to file for backup
-            with open('odissei_schema_live.json', 'w') as f:
-                json.dump(schema_data, f, indent=2)
-        else:
-            print("Failed to fetch data or received empty data")
+            print("Fetching data from SPARQL endpoint...")
+            new_data = sparql_client.fetch_schema_data()
+            if new_data and new_data.get('classes', {}).get('all'):
+                new_data = add_namespace_columns(new_data)
+                version = content_version(new_data)
+                if version == data_version:
+                    # Same schema as before; keep the current data so sessions aren't sent it again
+                    print("Schema data unchanged")
+                    return
+                
+                update_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                new_data['metadata']['last_updated'] = update_time
+                # Install the data and record its backup together, so a concurrent reload of
+                # the older backup can see it lost the race
+                with schema_lock:
+                    set_schema_data(new_data, update_time, version)
+                    
+                    # Save to file for backup
+                    write_schema_backup(orjson.dumps(new_data, option=orjson.OPT_INDENT_2))
+                print(f"Data updated successfully at {update_time}")
+            else:
+                print("Failed to fetch data or received empty data")
     except Exception as e:
         print(f"Error updating schema data: {e}")
 
-def background_update():
-    """Background thread to update data periodically"""
-    while True:
-        update_schema_data()
-        time.sleep(300)  # Update every 5 minutes
+backup_mtime = None
+
+def write_schema_backup(raw):
+    """Atomically replace the backup file; each write gets its own temp file so concurrent writers never mix"""
+    global backup_mtime
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(BACKUP_FILE)), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            mtime = os.fstat(f.fileno()).st_mtime
+        os.replace(tmp_path, BACKUP_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # Our own write is already loaded; don't reload it as if another worker had written it
+    backup_mtime = mtime
+
+def reload_schema_backup():
+    """Load data another process wrote to the backup file (the refresh job owner or a manual refresh)"""
+    global backup_mtime
+    try:
+        with schema_lock:
+            seen_mtime = backup_mtime
+        mtime = os.path.getmtime(BACKUP_FILE)
+        if mtime == seen_mtime:
+            return
+        with open(BACKUP_FILE, 'rb') as f:
+            new_data = orjson.loads(f.read())
+        # Backups written by earlier versions of the app lack the namespace columns
+        new_data = add_namespace_columns(new_data)
+        update_time = (new_data.get('metadata', {}).get('last_updated')
+                       or datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"))
+        version = content_version(new_data)
+        with schema_lock:
+            # This process installed newer data while we were reading the file; keep it
+            if backup_mtime != seen_mtime:
+                return
+            backup_mtime = mtime
+            set_schema_data(new_data, update_time, version)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Error reloading schema backup: {e}")
+
+scheduler_lock = None
 
-# Start background update thread
-update_thread = threading.Thread(target=background_update, daemon=True)
-update_thread.start()
+def acquire_scheduler_lock():
+    """Return True if this process should query the SPARQL endpoint (one process per host)"""
+    global scheduler_lock
+    scheduler_lock = open(SCHEDULER_LOCK_FILE, 'w')
+    try:
+        fcntl.flock(scheduler_lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError:
+        scheduler_lock.close()
+        return False
+
+# Schedule background updates. Only the process holding the lock file queries the
+# endpoint every 5 minutes; every worker (e.g. under gunicorn), including that one, picks
+# up backup files written by others, such as after a manual refresh.
+scheduler = BackgroundScheduler(daemon=True)
+if acquire_scheduler_lock():
+    scheduler.add_job(update_schema_data, 'interval', seconds=FETCH_INTERVAL,
+                      next_run_time=datetime.now(), max_instances=1, coalesce=True)
+scheduler.add_job(reload_schema_backup, 'interval', seconds=60,
+                  next_run_time=datetime.now(), max_instances=1, coalesce=True)
+scheduler.start()
+
+# Last computed layout position per node URI, reused to warm-start spring_layout
+_pos_cache = {}
 
 # Create network graph data
 def create_network_graph(selected_group='all'):
+    """Return the graph as NumPy node columns plus an (E, 2) array of node index pairs"""
     if not schema_data.get('classes', {}).get('all'):
-        return nx.Graph()
-        
-    G = nx.Graph()
-    
+        classes, predicates = [], []
     # Filter data based on selection
-    if selected_group == 'all':
+    elif selected_group == 'all':
         classes = schema_data['classes']['all'][:30]  # Limit for performance
         predicates = schema_data['predicates'].get('domain_specific', [])[:20]
     elif selected_group == 'domain_specific':
@@ -117,210 +249,74 @@ def create_network_graph(selected_group='all'):
     else:
         # Filter by namespace
         classes = [cls for cls in schema_data['classes']['all'] 
-                  if get_namespace_from_uri(cls['uri']) == selected_group][:20]
+                  if cls['namespace'] == selected_group][:20]
         predicates = [pred for pred in schema_data['predicates'].get('domain_specific', []) 
-                     if get_namespace_from_uri(pred['uri']) == selected_group][:15]
+                     if pred['namespace'] == selected_group][:15]
     
-    # Add nodes
+    # Add nodes, keyed by URI so a predicate sharing a class URI replaces it in place
+    nodes = {}
     for cls in classes:
-        G.add_node(cls['uri'], 
-                  label=cls['local_name'], 
-                  type='class',
-                  namespace=get_namespace_from_uri(cls['uri']))
+        nodes[cls['uri']] = (cls['local_name'], 'class', cls['namespace'])
     
     for pred in predicates:
-        G.add_node(pred['uri'], 
-                  label=pred['local_name'], 
-                  type='predicate',
-                  namespace=get_namespace_from_uri(pred['uri']))
+        nodes[pred['uri']] = (pred['local_name'], 'predicate', pred['namespace'])
+    
+    n = len(nodes)
+    graph = {
+        'uris': np.empty(n, dtype=object),
+        'labels': np.empty(n, dtype=object),
+        'types': np.empty(n, dtype=object),
+        'namespaces': np.empty(n, dtype=object)
+    }
+    for i, (uri, (label, node_type, namespace)) in enumerate(nodes.items()):
+        graph['uris'][i] = uri
+        graph['labels'][i] = label
+        graph['types'][i] = node_type
+        graph['namespaces'][i] = namespace
     
     # Add some sample edges
-    nodes = list(G.nodes())
-    for i in range(min(len(nodes) - 1, 25)):
-        if i % 3 == 0:
-            G.add_edge(nodes[i], nodes[i + 1])
-    
-    return G
-
-def create_plotly_network(G):
-    if not G.nodes():
-        return []
-        
-    # Use spring layout for positioning
-    pos = nx.spring_layout(G, k=3, iterations=50)
-    
-    # Create edge traces
-    edge_x = []
-    edge_y = []
-    for edge in G.edges():
-        x0, y0 = pos[edge[0]]
-        x1, y1 = pos[edge[1]]
-        edge_x.extend([x0, x1, None])
-        edge_y.extend([y0, y1, None])
-    
-    edge_trace = go.Scatter(x=edge_x, y=edge_y,
-                           line=dict(width=1, color='#E5E7EB'),
-                           hoverinfo='none',
-                           mode='lines')
-    
-    # Create node traces
-    node_x = []
-    node_y = []
-    node_text = []
-    node_colors = []
-    node_sizes = []
-    node_info = []
-    
-    for node in G.nodes():
-        x, y = pos[node]
-        node_x.append(x)
-        node_y.append(y)
-        
-        node_data = G.nodes[node]
-        node_text.append(node_data['label'])
-        node_colors.append(get_color_for_namespace(node_data['namespace']))
-        node_sizes.append(20 if node_data['type'] == 'class' else 15)
-        
-        # Create hover info
-        namespace_short = get_namespace_short_name(node_data['namespace'])
-        node_info.append(f"<b>{node_data['label']}</b><br>" +
-                        f"Type: {node_data['type']}<br>" +
-                        f"Namespace: {namespace_short}<br>" +
-                        f"URI: {node}")
-    
-    node_trace = go.Scatter(x=node_x, y=node_y,
-                           mode='markers+text',
-                           hovertemplate='%{hovertext}<extra></extra>',
-                           hovertext=node_info,
-                           text=node_text,
-                           textposition="top center",
-                           marker=dict(size=node_sizes,
-                                     color=node_colors,
-                                     line=dict(width=2, color='white')))
-    
-    return [edge_trace, node_trace]
-
-# App layout
-app.layout = dbc.Container([
-    # Interval component for live updates
-    dcc.Interval(
-        id='interval-component',
-        interval=60*1000,  # Update every minute
-        n_intervals=0
-    ),
-    
-    dbc.Row([
-        dbc.Col([
-            html.H1("ODISSEI Knowledge Graph Schema Explorer", 
-                   className="text-center mb-2"),
-            html.P("Live data from SPARQL endpoint - Auto-updates every minute",
-                   className="text-center text-muted mb-2"),
-            html.P(id="last-update-info", className="text-center text-sm text-muted mb-4")
-        ])
-    ]),
-    
-    # Statistics cards
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(id="total-classes", className="card-title"),
-                    html.P("Total Classes", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(id="total-predicates", className="card-title"),
-                    html.P("Total Predicates", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(id="odissei-namespaces", className="card-title"),
-                    html.P("ODISSEI Namespaces", className="card-text")
-                ])
-            ])
-        ], width=3),
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4(id="domain-predicates", className="card-title"),
-                    html.P("Domain Predicates", className="card-text")
-                ])
-            ])
-        ], width=3)
-    ], className="mb-4"),
+    graph['edges'] = np.array([(i, i + 1) for i in range(min(n - 1, 25)) if i % 3 == 0],
+                              dtype=np.int32).reshape(-1, 2)
     
-    # Manual refresh button
-    dbc.Row([
-        dbc.Col([
-            dbc.Button("🔄 Refresh Data Now", id="refresh-button", color="primary", size="sm")
-        ], width=12, className="text-center mb-3")
-    ]),
-    
-    # Tabs
-    dbc.Tabs([
-        dbc.Tab(label="Overview", tab_id="overview"),
-        dbc.Tab(label="Classes", tab_id="classes"),
-        dbc.Tab(label="Predicates", tab_id="predicates"),
-        dbc.Tab(label="Visualization", tab_id="visualization")
-    ], id="tabs", active_tab="overview"),
-    
-    html.Div(id="tab-content", className="mt-4")
-], fluid=True)
+    return graph
 
-# Callback to update statistics
-@app.callback(
-    [Output("total-classes", "children"),
-     Output("total-predicates", "children"),
-     Output("odissei-namespaces", "children"),
-     Output("domain-predicates", "children"),
-     Output("last-update-info", "children")],
-    [Input("interval-component", "n_intervals"),
-     Input("refresh-button", "n_clicks")]
-)
-def update_statistics(n_intervals, n_clicks):
-    global schema_data, last_update_time
-    
-    # Manual refresh if button clicked
-    if n_clicks:
-        update_schema_data()
-    
-    metadata = schema_data.get('metadata', {})
-    namespaces = schema_data.get('namespaces', {})
-    
-    update_info = f"Last updated: {last_update_time or 'Never'}"
-    
-    return (
-        str(metadata.get('total_classes', 0)),
-        str(metadata.get('total_predicates', 0)),
-        str(len(namespaces.get('odissei_namespaces', []))),
-        str(metadata.get('domain_specific_predicates', 0)),
-        update_info
-    )
-
-# Callback for tab content
-@app.callback(
-    Output("tab-content", "children"),
-    Input("tabs", "active_tab")
-)
-def render_tab_content(active_tab):
-    if active_tab == "overview":
-        return render_overview()
-    elif active_tab == "classes":
-        return render_classes()
-    elif active_tab == "predicates":
-        return render_predicates()
-    elif active_tab == "visualization":
-        return render_visualization()
+def create_graph_data(graph):
+    """Lay out the graph and return the node/edge columns the clientside figure is built from"""
+    n = len(graph['uris'])
+    if not n:
+        return {'edges': [], 'node_x': [], 'node_y': [], 'node_text': [],
+                'node_colors': [], 'node_sizes': [], 'node_info': []}
+    
+    # Use spring layout for positioning, warm-started from the positions nodes had in
+    # earlier layouts so fewer iterations are needed to converge. The layout graph only
+    # needs node indices and edges.
+    G = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(graph['edges'].tolist())
+    init_pos = {i: _pos_cache[uri] for i, uri in enumerate(graph['uris']) if uri in _pos_cache}
+    pos = nx.spring_layout(G, k=3, pos=init_pos or None, iterations=15, seed=42)
+    coords = np.array([pos[i] for i in range(n)], dtype=np.float32)
+    _pos_cache.update(zip(graph['uris'], coords))
+    
+    # Create hover info
+    node_info = [f"<b>{label}</b><br>" +
+                 f"Type: {node_type}<br>" +
+                 f"Namespace: {get_namespace_short_name(namespace)}<br>" +
+                 f"URI: {uri}"
+                 for uri, label, node_type, namespace in zip(graph['uris'], graph['labels'],
+                                                             graph['types'], graph['namespaces'])]
+    
+    return {
+        'edges': graph['edges'].tolist(),
+        'node_x': coords[:, 0].tolist(),
+        'node_y': coords[:, 1].tolist(),
+        'node_text': graph['labels'].tolist(),
+        'node_colors': [get_color_for_namespace(ns) for ns in graph['namespaces']],
+        'node_sizes': np.where(graph['types'] == 'class', 20, 15).tolist(),
+        'node_info': node_info
+    }
 
 def render_overview():
-    namespaces = schema_data.get('namespaces', {})
-    
     return dbc.Row([
         dbc.Col([
             dbc.Card([
@@ -330,21 +326,11 @@ def render_overview():
                     dbc.Row([
                         dbc.Col([
                             html.H5("ODISSEI Namespaces"),
-                            html.Ul([
-                                html.Li([
-                                    html.Span("●", style={"color": get_color_for_namespace(ns), "margin-right": "8px"}),
-                                    get_namespace_short_name(ns)
-                                ]) for ns in namespaces.get('odissei_namespaces', [])
-                            ])
+                            html.Ul(id="odissei-namespace-list")
                         ], width=6),
                         dbc.Col([
                             html.H5("Dataverse Namespaces"),
-                            html.Ul([
-                                html.Li([
-                                    html.Span("●", style={"color": get_color_for_namespace(ns), "margin-right": "8px"}),
-                                    get_namespace_short_name(ns)
-                                ]) for ns in namespaces.get('dataverse_namespaces', [])
-                            ])
+                            html.Ul(id="dataverse-namespace-list")
                         ], width=6)
                     ])
                 ])
@@ -370,7 +356,18 @@ def render_classes():
                             )
                         ], width=4)
                     ], className="mb-3"),
-                    html.Div(id="classes-table")
+                    dash_table.DataTable(
+                        id="classes-table-data",
+                        data=[],
+                        columns=[
+                            {"name": "Class Name", "id": "local_name"},
+                            {"name": "Namespace", "id": "namespace_short"},
+                            {"name": "URI", "id": "uri"}
+                        ],
+                        style_cell={'textAlign': 'left', 'fontSize': '12px'},
+                        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+                        page_size=20
+                    )
                 ])
             ])
         ])
@@ -394,7 +391,18 @@ def render_predicates():
                             )
                         ], width=4)
                     ], className="mb-3"),
-                    html.Div(id="predicates-table")
+                    dash_table.DataTable(
+                        id="predicates-table-data",
+                        data=[],
+                        columns=[
+                            {"name": "Predicate Name", "id": "local_name"},
+                            {"name": "Namespace", "id": "namespace_short"},
+                            {"name": "URI", "id": "uri"}
+                        ],
+                        style_cell={'textAlign': 'left', 'fontSize': '12px'},
+                        style_data={'whiteSpace': 'normal', 'height': 'auto'},
+                        page_size=20
+                    )
                 ])
             ])
         ])
@@ -418,115 +426,311 @@ def render_visualization():
                             )
                         ], width=4)
                     ], className="mb-3"),
+                    dcc.Store(id="graph-data"),
                     dcc.Graph(id="network-graph", style={"height": "600px"})
                 ])
             ])
         ])
     ])
 
-# Callbacks for filtering
-@app.callback(
-    Output("classes-table", "children"),
-    [Input("class-search", "value"),
-     Input("class-namespace-filter", "value"),
-     Input("interval-component", "n_intervals")]
-)
-def update_classes_table(search_term, namespace_filter, n_intervals):
-    classes = schema_data.get('classes', {}).get('all', [])
-    if not classes:
-        return html.P("No classes data available")
+# App layout
+app.layout = dbc.Container([
+    # Interval component for live updates
+    dcc.Interval(
+        id='interval-component',
+        interval=60*1000,  # Update every minute
+        n_intervals=0
+    ),
+    
+    # Schema snapshot shipped to the browser; only rewritten when the data version changes
+    dcc.Store(id='schema-store'),
+    
+    dbc.Row([
+        dbc.Col([
+            html.H1("ODISSEI Knowledge Graph Schema Explorer", 
+                   className="text-center mb-2"),
+            html.P("Live data from SPARQL endpoint - Auto-updates every minute",
+                   className="text-center text-muted mb-2"),
+            html.P(id="last-update-info", className="text-center text-sm text-muted mb-4")
+        ])
+    ]),
     
-    classes_df = pd.DataFrame(classes)
-    classes_df['namespace'] = classes_df['uri'].apply(get_namespace_from_uri)
-    classes_df['namespace_short'] = classes_df['namespace'].apply(get_namespace_short_name)
+    # Statistics cards
+    dbc.Row([
+        dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.H4(id="total-classes", className="card-title"),
+                    html.P("Total Classes", className="card-text")
+                ])
+            ])
+        ], width=3),
+        dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.H4(id="total-predicates", className="card-title"),
+                    html.P("Total Predicates", className="card-text")
+                ])
+            ])
+        ], width=3),
+        dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.H4(id="odissei-namespaces", className="card-title"),
+                    html.P("ODISSEI Namespaces", className="card-text")
+                ])
+            ])
+        ], width=3),
+        dbc.Col([
+            dbc.Card([
+                dbc.CardBody([
+                    html.H4(id="domain-predicates", className="card-title"),
+                    html.P("Domain Predicates", className="card-text")
+                ])
+            ])
+        ], width=3)
+    ], className="mb-4"),
     
-    # Apply filters
-    if search_term:
-        mask = classes_df['local_name'].str.contains(search_term, case=False, na=False) | \
-               classes_df['uri'].str.contains(search_term, case=False, na=False)
-        classes_df = classes_df[mask]
+    # Manual refresh button
+    dbc.Row([
+        dbc.Col([
+            dbc.Button("🔄 Refresh Data Now", id="refresh-button", color="primary", size="sm")
+        ], width=12, className="text-center mb-3")
+    ]),
     
-    if namespace_filter and namespace_filter != "all":
-        classes_df = classes_df[classes_df['namespace'] == namespace_filter]
+    # Tabs
+    dbc.Tabs([
+        dbc.Tab(label="Overview", tab_id="overview"),
+        dbc.Tab(label="Classes", tab_id="classes"),
+        dbc.Tab(label="Predicates", tab_id="predicates"),
+        dbc.Tab(label="Visualization", tab_id="visualization")
+    ], id="tabs", active_tab="overview"),
     
-    return dash_table.DataTable(
-        data=classes_df[['local_name', 'namespace_short', 'uri']].to_dict('records'),
-        columns=[
-            {"name": "Class Name", "id": "local_name"},
-            {"name": "Namespace", "id": "namespace_short"},
-            {"name": "URI", "id": "uri"}
-        ],
-        style_cell={'textAlign': 'left', 'fontSize': '12px'},
-        style_data={'whiteSpace': 'normal', 'height': 'auto'},
-        page_size=20
-    )
+    html.Div([
+        html.Div(render_overview(), id="overview-pane"),
+        html.Div(render_classes(), id="classes-pane", style={"display": "none"}),
+        html.Div(render_predicates(), id="predicates-pane", style={"display": "none"}),
+        html.Div(render_visualization(), id="visualization-pane", style={"display": "none"})
+    ], id="tab-content", className="mt-4")
+], fluid=True)
+
+def namespace_items(namespaces):
+    return [{"short_name": get_namespace_short_name(ns), "color": get_color_for_namespace(ns)}
+            for ns in namespaces]
 
+# Callback to publish schema data to the browser
 @app.callback(
-    Output("predicates-table", "children"),
+    Output("schema-store", "data"),
+    [Input("interval-component", "n_intervals"),
+     Input("refresh-button", "n_clicks")],
+    State("schema-store", "data")
+)
+def update_schema_store(n_intervals, n_clicks, current_data):
+    # Manual refresh if button clicked
+    if ctx.triggered_id == "refresh-button":
+        update_schema_data()
+    
+    with schema_lock:
+        data, version, update_time = schema_data, data_version, last_update_time
+    
+    # Skip the round-trip entirely unless this session holds different data
+    if current_data and current_data['data_version'] == version:
+        return no_update
+    
+    namespaces = data.get('namespaces', {})
+    return {
+        "data_version": version,
+        "last_update_time": update_time,
+        "metadata": data.get('metadata', {}),
+        "odissei_namespaces": namespace_items(namespaces.get('odissei_namespaces', [])),
+        "dataverse_namespaces": namespace_items(namespaces.get('dataverse_namespaces', [])),
+        "classes": data.get('classes', {}).get('all', []),
+        "predicates": data.get('predicates', {}).get('domain_specific', [])
+    }
+
+# Statistics cards are filled in the browser from the schema store
+clientside_callback(
+    """
+    function(store, ...current) {
+        if (!store) {
+            return Array(5).fill(window.dash_clientside.no_update);
+        }
+        const metadata = store.metadata;
+        const values = [
+            String(metadata.total_classes || 0),
+            String(metadata.total_predicates || 0),
+            String(store.odissei_namespaces.length),
+            String(metadata.domain_specific_predicates || 0),
+            'Last updated: ' + (store.last_update_time || 'Never')
+        ];
+        // Only send the cards whose text actually changed
+        return values.map((value, i) => value === current[i] ? window.dash_clientside.no_update : value);
+    }
+    """,
+    [Output("total-classes", "children"),
+     Output("total-predicates", "children"),
+     Output("odissei-namespaces", "children"),
+     Output("domain-predicates", "children"),
+     Output("last-update-info", "children")],
+    Input("schema-store", "data"),
+    [State("total-classes", "children"),
+     State("total-predicates", "children"),
+     State("odissei-namespaces", "children"),
+     State("domain-predicates", "children"),
+     State("last-update-info", "children")]
+)
+
+# Tab panes are all rendered once; switching tabs only toggles their visibility
+clientside_callback(
+    """
+    function(active_tab) {
+        return ['overview', 'classes', 'predicates', 'visualization'].map(
+            tab => ({display: tab === active_tab ? 'block' : 'none'})
+        );
+    }
+    """,
+    [Output("overview-pane", "style"),
+     Output("classes-pane", "style"),
+     Output("predicates-pane", "style"),
+     Output("visualization-pane", "style")],
+    Input("tabs", "active_tab")
+)
+
+# Namespace lists on the overview tab are rendered in the browser from the schema store
+NAMESPACE_LIST_JS = """
+function(store) {
+    if (!store) {
+        return window.dash_clientside.no_update;
+    }
+    return store.%s.map(item => ({
+        namespace: 'dash_html_components',
+        type: 'Li',
+        props: {children: [
+            {namespace: 'dash_html_components', type: 'Span',
+             props: {children: '●', style: {color: item.color, 'margin-right': '8px'}}},
+            item.short_name
+        ]}
+    }));
+}
+"""
+
+clientside_callback(
+    NAMESPACE_LIST_JS % "odissei_namespaces",
+    Output("odissei-namespace-list", "children"),
+    Input("schema-store", "data")
+)
+
+clientside_callback(
+    NAMESPACE_LIST_JS % "dataverse_namespaces",
+    Output("dataverse-namespace-list", "children"),
+    Input("schema-store", "data")
+)
+
+# Callbacks for filtering; the rows come from the schema store and are filtered in the browser
+FILTER_ROWS_JS = """
+function(search, namespace, store) {
+    const rows = (store && store.%s) || [];
+    const term = (search || '').toLowerCase();
+    return rows.filter(row =>
+        (!namespace || namespace === 'all' || row.namespace === namespace) &&
+        (!term || row.local_name.toLowerCase().includes(term) || row.uri.toLowerCase().includes(term))
+    );
+}
+"""
+
+clientside_callback(
+    FILTER_ROWS_JS % "classes",
+    Output("classes-table-data", "data"),
+    [Input("class-search", "value"),
+     Input("class-namespace-filter", "value"),
+     Input("schema-store", "data")]
+)
+
+clientside_callback(
+    FILTER_ROWS_JS % "predicates",
+    Output("predicates-table-data", "data"),
     [Input("predicate-search", "value"),
      Input("predicate-namespace-filter", "value"),
-     Input("interval-component", "n_intervals")]
+     Input("schema-store", "data")]
 )
-def update_predicates_table(search_term, namespace_filter, n_intervals):
-    predicates = schema_data.get('predicates', {}).get('domain_specific', [])
-    if not predicates:
-        return html.P("No predicates data available")
-    
-    predicates_df = pd.DataFrame(predicates)
-    predicates_df['namespace'] = predicates_df['uri'].apply(get_namespace_from_uri)
-    predicates_df['namespace_short'] = predicates_df['namespace'].apply(get_namespace_short_name)
-    
-    # Apply filters
-    if search_term:
-        mask = predicates_df['local_name'].str.contains(search_term, case=False, na=False) | \
-               predicates_df['uri'].str.contains(search_term, case=False, na=False)
-        predicates_df = predicates_df[mask]
-    
-    if namespace_filter and namespace_filter != "all":
-        predicates_df = predicates_df[predicates_df['namespace'] == namespace_filter]
-    
-    return dash_table.DataTable(
-        data=predicates_df[['local_name', 'namespace_short', 'uri']].to_dict('records'),
-        columns=[
-            {"name": "Predicate Name", "id": "local_name"},
-            {"name": "Namespace", "id": "namespace_short"},
-            {"name": "URI", "id": "uri"}
-        ],
-        style_cell={'textAlign': 'left', 'fontSize': '12px'},
-        style_data={'whiteSpace': 'normal', 'height': 'auto'},
-        page_size=20
-    )
 
 @app.callback(
-    Output("network-graph", "figure"),
+    Output("graph-data", "data"),
     [Input("viz-group-selector", "value"),
-     Input("interval-component", "n_intervals")]
+     Input("interval-component", "n_intervals")],
+    State("graph-data", "data")
+)
+def update_graph_data(selected_group, n_intervals, current_data):
+    with schema_lock:
+        version = data_version
+    
+    # Only ship new coordinates when the selection or the underlying data changed
+    if current_data and current_data['group'] == selected_group and current_data['data_version'] == version:
+        return no_update
+    return compute_graph_data(selected_group, version)
+
+@cache.memoize()
+def compute_graph_data(selected_group, data_version):
+    """Build the network graph data; memoized until the schema data changes"""
+    graph_data = create_graph_data(create_network_graph(selected_group))
+    graph_data.update(group=selected_group,
+                      data_version=data_version,
+                      title=f"Schema Network - {selected_group.replace('_', ' ').title()}")
+    return graph_data
+
+# Assemble the figure in the browser from the stored graph data
+clientside_callback(
+    """
+    function(graph) {
+        if (!graph) {
+            return window.dash_clientside.no_update;
+        }
+        // Each edge is drawn as (start, end, null) so segments stay disconnected
+        const edge_x = graph.edges.flatMap(([i, j]) => [graph.node_x[i], graph.node_x[j], null]);
+        const edge_y = graph.edges.flatMap(([i, j]) => [graph.node_y[i], graph.node_y[j], null]);
+        return {
+            data: [
+                {type: 'scattergl', x: edge_x, y: edge_y,
+                 line: {width: 1, color: '#E5E7EB'},
+                 hoverinfo: 'none',
+                 mode: 'lines'},
+                {type: 'scattergl', x: graph.node_x, y: graph.node_y,
+                 mode: 'markers+text',
+                 hovertemplate: '%{hovertext}<extra></extra>',
+                 hovertext: graph.node_info,
+                 text: graph.node_text,
+                 textposition: 'top center',
+                 marker: {size: graph.node_sizes,
+                          color: graph.node_colors,
+                          line: {width: 2, color: 'white'}}}
+            ],
+            layout: {
+                // Keep the user's zoom/pan across refreshes of the same group and reset it when
+                // the group changes; the edge and node traces always come in the same order so
+                // Plotly can update them in place
+                uirevision: graph.group,
+                title: {text: graph.title, font: {size: 16}},
+                showlegend: false,
+                hovermode: 'closest',
+                margin: {b: 20, l: 5, r: 5, t: 40},
+                annotations: [{
+                    text: 'Live data from SPARQL endpoint - Click and drag to explore',
+                    showarrow: false,
+                    xref: 'paper', yref: 'paper',
+                    x: 0.005, y: -0.002,
+                    xanchor: 'left', yanchor: 'bottom',
+                    font: {color: '#888', size: 12}
+                }],
+                xaxis: {showgrid: false, zeroline: false, showticklabels: false},
+                yaxis: {showgrid: false, zeroline: false, showticklabels: false},
+                plot_bgcolor: 'white'
+            }
+        };
+    }
+    """,
+    Output("network-graph", "figure"),
+    Input("graph-data", "data")
 )
-def update_network_graph(selected_group, n_intervals):
-    G = create_network_graph(selected_group)
-    traces = create_plotly_network(G)
-    
-    fig = go.Figure(data=traces,
-                   layout=go.Layout(
-                       title=f"Schema Network - {selected_group.replace('_', ' ').title()}",
-                       titlefont_size=16,
-                       showlegend=False,
-                       hovermode='closest',
-                       margin=dict(b=20,l=5,r=5,t=40),
-                       annotations=[ dict(
-                           text="Live data from SPARQL endpoint - Click and drag to explore",
-                           showarrow=False,
-                           xref="paper", yref="paper",
-                           x=0.005, y=-0.002,
-                           xanchor="left", yanchor="bottom",
-                           font=dict(color="#888", size=12)
-                       )],
-                       xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       yaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-                       plot_bgcolor='white'
-                   ))
-    
-    return fig
 
 if __name__ == "__main__":
     # Initial data fetch
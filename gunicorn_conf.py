@@ -0,0 +1,12 @@
+# Gunicorn configuration for serving the static-data app in production:
+#   gunicorn -c gunicorn_conf.py app:server
+import os
+
+bind = "0.0.0.0:8050"
+workers = os.cpu_count() or 1
+worker_class = "gthread"
+threads = 4
+
+# Load the app (schema file and precomputed DataFrames) once in the master so
+# workers share it copy-on-write after fork
+preload_app = True
@@ -1,13 +1,21 @@
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import orjson
 import logging
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
-from urllib.parse import quote
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Namespaces whose predicates/classes are considered domain-specific
+DOMAIN_RE = re.compile(r'odissei|dataverse')
+DOMAIN_RE_CLASSES = re.compile(r'odissei|dataverse|w3id\.org|foaf')
+
 class SPARQLClient:
     """Client for querying the ODISSEI SPARQL endpoint"""
     
@@ -16,25 +24,32 @@ class SPARQLClient:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'ODISSEI-Schema-Visualizer/1.0',
-            'Accept': 'application/json'
+            'Accept': 'application/sparql-results+json'
         })
+        
+        # Reuse pooled keep-alive connections across queries and refreshes, and retry
+        # connection errors and transient gateway errors. SPARQL SELECT queries are read-only,
+        # so POST is safe to retry. Read timeouts are not retried: a stalled endpoint would
+        # otherwise hold a refresh for several full timeouts.
+        retries = Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504],
+                        allowed_methods=frozenset({'GET', 'POST'}))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
     
     def execute_query(self, query: str) -> Optional[Dict]:
         """Execute a SPARQL query and return the results"""
         try:
-            # URL encode the query
-            encoded_query = quote(query)
-            url = f"{self.endpoint_url}?query={encoded_query}"
-            
             logger.info(f"Executing SPARQL query: {query[:100]}...")
             
-            response = self.session.get(url, timeout=30)
+            # POST the query as a form field to avoid URL length limits
+            response = self.session.post(self.endpoint_url, data={'query': query}, timeout=30)
             response.raise_for_status()
             
             # Try to parse as JSON
             try:
-                return response.json()
-            except json.JSONDecodeError:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
                 # If not JSON, return the text content
                 logger.warning("Response is not valid JSON, returning text")
                 return {"results": {"bindings": []}}
@@ -118,50 +133,62 @@ class SPARQLClient:
         
         return classes
     
-    def _extract_local_name(self, uri: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_local_name(uri: str) -> str:
         """Extract local name from URI"""
         if '#' in uri:
-            return uri.split('#')[-1]
+            return uri.rpartition('#')[2]
         else:
-            return uri.split('/')[-1]
+            return uri.rpartition('/')[2]
     
-    def get_namespace_from_uri(self, uri: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def get_namespace_from_uri(uri: str) -> str:
         """Extract namespace from URI"""
         if '#' in uri:
-            return uri.split('#')[0] + '#'
+            return uri.partition('#')[0] + '#'
         else:
-            parts = uri.split('/')
-            return '/'.join(parts[:-1]) + '/'
+            return uri.rpartition('/')[0] + '/'
     
     def fetch_schema_data(self) -> Dict:
         """Fetch complete schema data from the endpoint"""
         logger.info("Fetching schema data from SPARQL endpoint...")
         
-        # Get predicates and classes
-        predicates = self.get_distinct_predicates(100)
-        classes = self.get_distinct_classes(100)
+        # Get predicates and classes; the two queries are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            predicates_future = executor.submit(self.get_distinct_predicates, 100)
+            classes_future = executor.submit(self.get_distinct_classes, 100)
+            predicates = predicates_future.result()
+            classes = classes_future.result()
         
         # Process the data
         all_namespaces = set()
         odissei_namespaces = []
         dataverse_namespaces = []
+        odissei_seen = set()
+        dataverse_seen = set()
         domain_specific_predicates = []
         domain_specific_classes = []
         
         # Process predicates
         for pred in predicates:
             namespace = self.get_namespace_from_uri(pred['uri'])
+            ns_lower = namespace.lower()
             all_namespaces.add(namespace)
             
             # Filter domain-specific predicates
-            if any(domain in namespace.lower() for domain in ['odissei', 'dataverse']):
+            if DOMAIN_RE.search(ns_lower):
                 domain_specific_predicates.append(pred)
                 
-                if 'odissei' in namespace.lower():
-                    if namespace not in odissei_namespaces:
+                # Track membership in sets; the lists keep first-seen order
+                if 'odissei' in ns_lower:
+                    if namespace not in odissei_seen:
+                        odissei_seen.add(namespace)
                         odissei_namespaces.append(namespace)
-                elif 'dataverse' in namespace.lower():
-                    if namespace not in dataverse_namespaces:
+                elif 'dataverse' in ns_lower:
+                    if namespace not in dataverse_seen:
+                        dataverse_seen.add(namespace)
                         dataverse_namespaces.append(namespace)
         
         # Process classes
@@ -170,7 +197,7 @@ class SPARQLClient:
             all_namespaces.add(namespace)
             
             # Filter domain-specific classes
-            if any(domain in namespace.lower() for domain in ['odissei', 'dataverse', 'w3id.org', 'foaf']):
+            if DOMAIN_RE_CLASSES.search(namespace.lower()):
                 domain_specific_classes.append(cls)
         
         # Create schema data structure